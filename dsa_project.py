@@ -1,68 +1,52 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 import heapq
+import itertools
+import logging
+import sys
 
-# Linked List Node for the waitlist
-class Node:
-    def __init__(self, user):
-        self.user = user  # Store user information
-        self.next = None  # Pointer to the next node in the linked list
+log = logging.getLogger("registration")  # Status messages; silence with setLevel(logging.WARNING)
+UNDO_LIMIT = 1024  # Maximum number of actions kept for undo
 
-# Linked List implementation for the waitlist
-class LinkedList:
-    def __init__(self):
-        self.head = None  # Initialize head of the linked list
-
-    def append(self, user):
-        """Add a user to the end of the linked list."""
-        new_node = Node(user)  # Create a new node with the user
-        if not self.head:  # If the list is empty
-            self.head = new_node  # Set new node as head
-            return
-        current = self.head
-        while current.next:  # Traverse to the end of the list
-            current = current.next
-        current.next = new_node  # Append the new node
-
-    def pop(self):
-        """Remove and return the first user from the linked list."""
-        if not self.head:  # If the list is empty
-            return None
-        popped_user = self.head.user  # Get the user from the head
-        self.head = self.head.next  # Move head to the next node
-        return popped_user  # Return the popped user
-
-    def is_empty(self):
-        """Check if the linked list is empty."""
-        return self.head is None
-
-    def display(self):
-        """Return a list of users in the linked list."""
-        current = self.head
-        users = []
-        while current:
-            users.append(current.user)  # Collect users in a list
-            current = current.next
-        return users  # Return the list of users
+def write_report(parts):
+    """Write report lines to stdout with a single write call instead of one print per line."""
+    sys.stdout.write("\n".join(parts) + "\n")
 
 # User class to store user information
 class User:
+    __slots__ = ('user_id', 'name', 'email', '_str')  # No per-instance __dict__
+
     def __init__(self, user_id, name, email):
         self.user_id = user_id  # Unique user ID
         self.name = name  # User's name
         self.email = email  # User's email
+        self._str = f"{name} ({email})"  # Display string, built once since users don't change
 
     def __str__(self):
         """String representation of the user."""
-        return f"{self.name} ({self.email})"
+        return self._str
+
+    def __eq__(self, other):
+        """Users are equal when they share the same user ID."""
+        return isinstance(other, User) and self.user_id == other.user_id
+
+    def __hash__(self):
+        """Hash on the user ID so users can be stored in sets."""
+        return hash(self.user_id)
 
 # Workshop class to manage workshop details and participants
 class Workshop:
+    __slots__ = ('title', 'max_participants', 'registered_users', 'waitlist',
+                 'priority_queue', '_queued_set', '_sorted_view', '_heap_counter')
+
     def __init__(self, title, max_participants):
         self.title = title  # Title of the workshop
         self.max_participants = max_participants  # Max number of participants
-        self.registered_users = []  # List of registered users
-        self.waitlist = LinkedList()  # Waitlist for users
+        self.registered_users = {}  # Registered users by user ID (keeps registration order)
+        self.waitlist = deque()  # Waitlist for users (FIFO)
         self.priority_queue = []  # Priority queue for user registrations
+        self._queued_set = set()  # Users currently in the priority queue
+        self._sorted_view = None  # Cached sorted copy of the priority queue
+        self._heap_counter = itertools.count()  # Tiebreaker so equal priorities keep arrival order
 
     def is_full(self):
         """Check if the workshop is full."""
@@ -70,71 +54,137 @@ class Workshop:
 
     def is_user_registered_or_queued(self, user):
         """Check if a user is already registered or in the priority queue."""
-        if user in self.registered_users:
-            return True
-        for _, queued_user in self.priority_queue:
-            if queued_user == user:
-                return True
-        return False
+        return user.user_id in self.registered_users or user in self._queued_set
 
     def add_user(self, user, priority=0):
         """Add a user to the workshop or waitlist based on availability."""
         if self.is_user_registered_or_queued(user):
-            print(f"{user} is already registered or in the queue for '{self.title}'.")
+            log.warning("%s is already registered or in the queue for '%s'.", user, self.title)
             return
 
         if self.is_full():
-            print(f"Workshop '{self.title}' is full. Adding {user} to the waitlist.")
+            log.info("Workshop '%s' is full. Adding %s to the waitlist.", self.title, user)
             self.waitlist.append(user)  # Add user to waitlist
         else:
-            heapq.heappush(self.priority_queue, (priority, user))  # Add user to priority queue
-            print(f"{user} registered for '{self.title}' with priority {priority}.")
+            heapq.heappush(self.priority_queue, (priority, next(self._heap_counter), user))  # Add user to priority queue
+            self._queued_set.add(user)
+            self._sorted_view = None  # Queue changed, drop cached view
+            log.info("%s registered for '%s' with priority %s.", user, self.title, priority)
+
+    def add_users(self, entries):
+        """Add many (user, priority) pairs at once and seat them by priority.
+
+        Every new entry joins the priority queue, which is sorted once: the best priorities
+        fill the open seats and everyone else goes to the waitlist in priority order. This
+        differs from making the same add_user calls one at a time, where seats and waitlist
+        places go first-come, first-served.
+        """
+        queue = self.priority_queue
+        queued = False
+        for user, priority in entries:
+            if self.is_user_registered_or_queued(user):
+                log.warning("%s is already registered or in the queue for '%s'.", user, self.title)
+                continue
+            queue.append((priority, next(self._heap_counter), user))
+            self._queued_set.add(user)
+            queued = True
+
+        if not queued:
+            return
+        ranked = sorted(queue)  # One sort decides both the seats and the waitlist order
+        open_seats = max(self.max_participants - len(self.registered_users), 0)
+        self.priority_queue = []
+        self._sorted_view = None  # Queue changed, drop cached view
+        self._seat(ranked[:open_seats])
+
+        for _, _, user in ranked[open_seats:]:  # Workshop is full; the rest wait in priority order
+            log.info("Workshop '%s' is full. Adding %s to the waitlist.", self.title, user)
+            self.waitlist.append(user)
+        self._queued_set.clear()
 
     def process_registration(self):
         """Process registrations from the priority queue until the workshop is full."""
-        while len(self.registered_users) < self.max_participants and self.priority_queue:
-            _, user = heapq.heappop(self.priority_queue)  # Pop the user with highest priority
-            self.registered_users.append(user)  # Add user to registered users
-            print(f"User {user} added from the priority queue to registered list.")
+        queue = self.priority_queue
+        open_seats = self.max_participants - len(self.registered_users)
+        if open_seats <= 0 or not queue:
+            return
+
+        if open_seats >= len(queue) // 2:
+            # Filling most of the queue: one sort beats many heappops, and a sorted list is still a heap
+            entries = sorted(queue)
+            batch, self.priority_queue = entries[:open_seats], entries[open_seats:]
+        else:
+            heappop = heapq.heappop
+            batch = [heappop(queue) for _ in range(open_seats)]
+        self._sorted_view = None  # Queue changed, drop cached view
+        self._seat(batch)
+
+    def _seat(self, batch):
+        """Move (priority, counter, user) entries, in priority order, into registered users."""
+        # Bind hot-loop lookups to locals once instead of per user
+        registered = self.registered_users
+        discard_queued = self._queued_set.discard
+        log_enabled = log.isEnabledFor(logging.INFO)
+        for _, _, user in batch:  # Users in priority order
+            discard_queued(user)
+            registered[user.user_id] = user  # Add user to registered users
+            if log_enabled:
+                log.info("User %s added from the priority queue to registered list.", user)
 
     def remove_user(self, user):
         """Remove a user from the workshop and manage waitlist."""
-        if user in self.registered_users:
-            self.registered_users.remove(user)  # Remove user from registered list
-            print(f"{user} deregistered from '{self.title}'.")
-            if not self.waitlist.is_empty():
-                next_user = self.waitlist.pop()  # Pop user from waitlist
-                self.registered_users.append(next_user)  # Add to registered users
-                print(f"{next_user} moved from waitlist to registered for '{self.title}'.")
+        if user.user_id in self.registered_users:
+            del self.registered_users[user.user_id]  # Remove user from registered users
+            log.info("%s deregistered from '%s'.", user, self.title)
+            if self.waitlist:
+                next_user = self.waitlist.popleft()  # Pop user from front of waitlist
+                self.registered_users[next_user.user_id] = next_user  # Add to registered users
+                log.info("%s moved from waitlist to registered for '%s'.", next_user, self.title)
         else:
-            print(f"{user} is not registered for '{self.title}'.")
+            log.warning("%s is not registered for '%s'.", user, self.title)
 
-    def show_registered_users(self):
-        """Display registered users for the workshop."""
-        print(f"Registered users for '{self.title}':")
+    def registered_users_lines(self, parts):
+        """Append the registered-users report lines to parts."""
+        parts.append(f"Registered users for '{self.title}':")
         if not self.registered_users:
-            print("0")
-        for user in self.registered_users:
-            print(f"- {user}")
+            parts.append("0")
+        parts.extend(f"- {user}" for user in self.registered_users.values())
 
-    def show_priority_queue(self):
-        """Display users in the priority queue."""
+    def priority_queue_lines(self, parts):
+        """Append the priority-queue report lines to parts, in priority order."""
         if self.priority_queue:
-            print(f"Priority queue for '{self.title}':")
-            for priority, user in self.priority_queue:
-                print(f"- {user} (priority {priority})")
+            if self._sorted_view is None:  # Only re-sort after the queue has changed
+                self._sorted_view = sorted(self.priority_queue)
+            parts.append(f"Priority queue for '{self.title}':")
+            parts.extend(f"- {user} (priority {priority})" for priority, _, user in self._sorted_view)
         else:
-            print(f"Priority queue for '{self.title}': 0")
+            parts.append(f"Priority queue for '{self.title}': 0")
+
+    def waitlist_lines(self, parts):
+        """Append the waitlist report lines to parts."""
+        if self.waitlist:
+            parts.append(f"Waitlist for '{self.title}':")
+            parts.extend(f"- {user}" for user in self.waitlist)
+        else:
+            parts.append(f"Waitlist for '{self.title}': 0")
+
+    def show_registered_users(self):
+        """Display registered users for the workshop."""
+        parts = []
+        self.registered_users_lines(parts)
+        write_report(parts)
+
+    def show_priority_queue(self):
+        """Display users in the priority queue in priority order."""
+        parts = []
+        self.priority_queue_lines(parts)
+        write_report(parts)
 
     def show_waitlist(self):
         """Display users in the waitlist."""
-        waitlist_users = self.waitlist.display()
-        if waitlist_users:
-            print(f"Waitlist for '{self.title}':")
-            for user in waitlist_users:
-                print(f"- {user}")
-        else:
-            print(f"Waitlist for '{self.title}': 0")
+        parts = []
+        self.waitlist_lines(parts)
+        write_report(parts)
 
 # The remaining classes and methods remain the same. 
 # Please let me know if you'd like me to include them as well for reference.
@@ -144,37 +194,58 @@ class Workshop:
 class Graph:
     def __init__(self):
         self.graph = defaultdict(list)  # Store prerequisites as an adjacency list
+        self.indegree = defaultdict(int)  # Number of prerequisites for each workshop
+        self._topo_cache = None  # Last topological order, cleared when edges change
 
     def add_edge(self, prerequisite, dependent):
         """Add a prerequisite relationship between two workshops."""
         self.graph[prerequisite].append(dependent)
+        self.indegree[dependent] += 1
+        self._topo_cache = None  # Graph changed, order must be recomputed
 
-    def topological_sort(self):
-        """Perform topological sorting to find workshop order."""
-        visited = set()
-        stack = []
-
-        def dfs(workshop):
-            """Depth-first search to visit nodes."""
-            visited.add(workshop)
-            for neighbor in self.graph[workshop]:
-                if neighbor not in visited:
-                    dfs(neighbor)
-            stack.append(workshop)  # Add workshop to stack after visiting all dependencies
+    def remove_edge(self, prerequisite, dependent):
+        """Remove a prerequisite relationship between two workshops."""
+        self.graph[prerequisite].remove(dependent)
+        self.indegree[dependent] -= 1
+        self._topo_cache = None  # Graph changed, order must be recomputed
 
-        for workshop in list(self.graph):
-            if workshop not in visited:
-                dfs(workshop)
-
-        return stack[::-1]  # Return stack in reverse order for topological sorting
+    def topological_sort(self):
+        """Perform topological sorting (Kahn's algorithm) to find workshop order.
+
+        Returns a tuple (previously a list), cached until the next add_edge/remove_edge.
+        Raises ValueError if the prerequisites contain a cycle.
+        """
+        if self._topo_cache is not None:
+            return self._topo_cache
+
+        indegree = dict(self.indegree)  # Work on a copy so the stored counts stay intact
+        queue = deque(workshop for workshop in self.graph if not indegree.get(workshop))
+        order = []
+
+        while queue:
+            workshop = queue.popleft()
+            order.append(workshop)
+            for neighbor in self.graph.get(workshop, ()):
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:  # All prerequisites of neighbor are placed
+                    queue.append(neighbor)
+
+        # Nodes on or after a cycle never reach indegree 0; don't return a partial order
+        workshops = set(self.graph).union(w for w, count in self.indegree.items() if count)
+        if len(order) != len(workshops):
+            stuck = sorted(map(str, workshops.difference(order)))
+            raise ValueError(f"Prerequisite cycle; cannot order: {', '.join(stuck)}")
+
+        self._topo_cache = tuple(order)  # Immutable, so callers can't corrupt the cache
+        return self._topo_cache
 
     def has_prerequisites(self, workshop):
         """Check if a workshop has prerequisites."""
-        return bool(self.graph[workshop])
+        return bool(self.graph.get(workshop))  # .get avoids inserting an empty entry
 
     def get_prerequisites(self, workshop):
         """Get a list of prerequisites for a given workshop."""
-        return self.graph[workshop] if workshop in self.graph else []
+        return self.graph.get(workshop, ())
 
 # Main registration system class to manage users and workshops
 class RegistrationSystem:
@@ -182,75 +253,108 @@ class RegistrationSystem:
         self.users = {}  # Store users by user ID
         self.workshops = {}  # Store workshops by title
         self.prerequisite_graph = Graph()  # Graph for managing prerequisites
-        self.undo_stack = []  # Stack to keep track of actions for undo functionality
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)  # Stack of recent actions for undo; oldest are dropped
 
     def add_user(self, user_id, name, email):
         """Add a user to the system after validating their email."""
         # Check if the email contains '@'
         if '@' not in email:
-            print("Invalid email format. Please enter a valid email with '@'.")
+            log.warning("Invalid email format. Please enter a valid email with '@'.")
             return
 
+        if isinstance(user_id, str):
+            user_id = sys.intern(user_id)  # Interned keys make later dict lookups a pointer compare
         user = User(user_id, name, email)  # Create a new User object
         self.users[user_id] = user  # Add user to the system
         self.undo_stack.append(('add_user', user))  # Store action for undo
-        print(f"User {user} added to the system.")
+        log.info("User %s added to the system.", user)
 
     def add_workshop(self, title, max_participants):
         """Add a workshop to the system."""
+        if isinstance(title, str):
+            title = sys.intern(title)  # Interned keys make later dict lookups a pointer compare
         workshop = Workshop(title, max_participants)  # Create a new Workshop object
         self.workshops[title] = workshop  # Add workshop to the system
         self.undo_stack.append(('add_workshop', workshop))  # Store action for undo
-        print(f"Workshop '{title}' added with a maximum of {max_participants} participants.")
+        log.info("Workshop '%s' added with a maximum of %s participants.", title, max_participants)
 
     def add_prerequisite(self, prerequisite, dependent):
         """Add a prerequisite relationship between two workshops."""
         if prerequisite not in self.workshops or dependent not in self.workshops:
-            print("Both workshops must exist before adding a prerequisite.")
+            log.warning("Both workshops must exist before adding a prerequisite.")
             return
         self.prerequisite_graph.add_edge(prerequisite, dependent)  # Add edge in the graph
         self.undo_stack.append(('add_prerequisite', prerequisite, dependent))  # Store action for undo
-        print(f"Added prerequisite: '{prerequisite}' must be completed before '{dependent}'.")
+        log.info("Added prerequisite: '%s' must be completed before '%s'.", prerequisite, dependent)
 
     def check_prerequisites(self, user_id, workshop_title):
         """Check if a user has completed prerequisites for a workshop."""
         prerequisites = self.prerequisite_graph.get_prerequisites(workshop_title)
         for prereq in prerequisites:
-            if not any(user_id == u.user_id for u in self.workshops[prereq].registered_users):
-                print(f"User {user_id} has not completed prerequisite workshop '{prereq}'.")
+            if user_id not in self.workshops[prereq].registered_users:
+                log.warning("User %s has not completed prerequisite workshop '%s'.", user_id, prereq)
                 return False
         return True
 
     def register_user_for_workshop(self, user_id, workshop_title, priority=0):
         """Register a user for a workshop if prerequisites are met."""
-        user = self.users.get(user_id)  # Get user by ID
-        workshop = self.workshops.get(workshop_title)  # Get workshop by title
-
-        if user is None:
-            print(f"User ID {user_id} not found.")
+        try:
+            user = self.users[user_id]  # Get user by ID
+        except KeyError:
+            log.warning("User ID %s not found.", user_id)
             return
-        if workshop is None:
-            print(f"Workshop '{workshop_title}' not found.")
+        try:
+            workshop = self.workshops[workshop_title]  # Get workshop by title
+        except KeyError:
+            log.warning("Workshop '%s' not found.", workshop_title)
             return
 
         if not self.check_prerequisites(user_id, workshop_title):
-            print(f"User {user_id} cannot register for '{workshop_title}' due to unmet prerequisites.")
+            log.warning("User %s cannot register for '%s' due to unmet prerequisites.", user_id, workshop_title)
             return
 
         workshop.add_user(user, priority)  # Attempt to register user in workshop
         workshop.process_registration()  # Process registrations from the priority queue
         self.undo_stack.append(('register', user, workshop_title))  # Store action for undo
 
+    def register_many(self, items):
+        """Register many (user_id, workshop_title, priority) entries, processing each workshop once.
+
+        Within each workshop, seats and waitlist places go by priority (ties by order in
+        items), so the result can differ from calling register_user_for_workshop for each
+        entry in turn, which is first-come, first-served. Prerequisites are checked against
+        registrations that existed before this call.
+        """
+        pending = defaultdict(list)  # Workshop title -> [(user, priority), ...]
+        for user_id, workshop_title, priority in items:
+            try:
+                user = self.users[user_id]  # Get user by ID
+            except KeyError:
+                log.warning("User ID %s not found.", user_id)
+                continue
+            if workshop_title not in self.workshops:
+                log.warning("Workshop '%s' not found.", workshop_title)
+                continue
+            if not self.check_prerequisites(user_id, workshop_title):
+                log.warning("User %s cannot register for '%s' due to unmet prerequisites.", user_id, workshop_title)
+                continue
+            pending[workshop_title].append((user, priority))
+            self.undo_stack.append(('register', user, workshop_title))  # Store action for undo
+
+        for workshop_title, entries in pending.items():
+            self.workshops[workshop_title].add_users(entries)  # One heapify and drain per workshop
+
     def deregister_user_from_workshop(self, user_id, workshop_title):
         """Deregister a user from a workshop."""
-        user = self.users.get(user_id)  # Get user by ID
-        workshop = self.workshops.get(workshop_title)  # Get workshop by title
-
-        if user is None:
-            print(f"User ID {user_id} not found.")
+        try:
+            user = self.users[user_id]  # Get user by ID
+        except KeyError:
+            log.warning("User ID %s not found.", user_id)
             return
-        if workshop is None:
-            print(f"Workshop '{workshop_title}' not found.")
+        try:
+            workshop = self.workshops[workshop_title]  # Get workshop by title
+        except KeyError:
+            log.warning("Workshop '%s' not found.", workshop_title)
             return
 
         workshop.remove_user(user)  # Remove user from workshop
@@ -258,50 +362,52 @@ class RegistrationSystem:
 
     def show_workshop_details(self):
         """Show details of all workshops."""
-        print("Workshop details:")
+        parts = ["Workshop details:"]
         for workshop in self.workshops.values():
-            print(f"Title: {workshop.title}, Max Participants: {workshop.max_participants}, Registered: {len(workshop.registered_users)}")
-            workshop.show_registered_users()  # Show registered users
-            workshop.show_waitlist()  # Show waitlist
-            workshop.show_priority_queue()  # Show priority queue
+            parts.append(f"Title: {workshop.title}, Max Participants: {workshop.max_participants}, Registered: {len(workshop.registered_users)}")
+            workshop.registered_users_lines(parts)  # Registered users
+            workshop.waitlist_lines(parts)  # Waitlist
+            workshop.priority_queue_lines(parts)  # Priority queue
+        write_report(parts)  # One write for the whole report
 
     def show_user_details(self):
         """Show details of all users."""
-        print("User details:")
-        for user in self.users.values():
-            print(f"- {user}")
+        parts = ["User details:"]
+        parts.extend(f"- {user}" for user in self.users.values())
+        write_report(parts)  # One write for the whole report
 
     def undo_last_action(self):
         """Undo the last action performed."""
         if not self.undo_stack:
-            print("No actions to undo.")
+            log.warning("No actions to undo.")
             return
 
         action = self.undo_stack.pop()  # Get the last action
         if action[0] == 'add_user':
             user = action[1]
             del self.users[user.user_id]  # Remove user from the system
-            print(f"Undo: User {user} removed from the system.")
+            log.info("Undo: User %s removed from the system.", user)
         elif action[0] == 'add_workshop':
             workshop = action[1]
             del self.workshops[workshop.title]  # Remove workshop from the system
-            print(f"Undo: Workshop '{workshop.title}' removed from the system.")
+            log.info("Undo: Workshop '%s' removed from the system.", workshop.title)
         elif action[0] == 'add_prerequisite':
             prerequisite, dependent = action[1], action[2]
-            self.prerequisite_graph.graph[prerequisite].remove(dependent)  # Remove prerequisite edge
-            print(f"Undo: Prerequisite '{prerequisite}' removed from '{dependent}'.")
+            self.prerequisite_graph.remove_edge(prerequisite, dependent)  # Remove prerequisite edge
+            log.info("Undo: Prerequisite '%s' removed from '%s'.", prerequisite, dependent)
         elif action[0] == 'register':
             user, workshop_title = action[1], action[2]
             workshop = self.workshops[workshop_title]
             workshop.remove_user(user)  # Remove user from the workshop
-            print(f"Undo: User {user} deregistered from '{workshop_title}'.")
+            log.info("Undo: User %s deregistered from '%s'.", user, workshop_title)
         elif action[0] == 'deregister':
             user, workshop_title = action[1], action[2]
             workshop = self.workshops[workshop_title]
             workshop.add_user(user)  # Re-add user to the workshop
-            print(f"Undo: User {user} re-registered for '{workshop_title}'.")
+            log.info("Undo: User %s re-registered for '%s'.", user, workshop_title)
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)  # Show status messages in the menu
     registration_system = RegistrationSystem()  # Create a new registration system
 
     while True:
@@ -330,8 +436,8 @@ def main():
             registration_system.add_workshop(title, int(max_participants))  # Add workshop
         #the time complexity is O(1)
         elif choice == '3':
-            prerequisite = input("Enter prerequisite workshop title: ")  # Get prerequisite title
-            dependent = input("Enter dependent workshop title: ")  # Get dependent title
+            prerequisite = sys.intern(input("Enter prerequisite workshop title: "))  # Get prerequisite title
+            dependent = sys.intern(input("Enter dependent workshop title: "))  # Get dependent title
             registration_system.add_prerequisite(prerequisite, dependent)  # Add prerequisite
          #the time complexity is O(v+e) or O(n) where v is vertex and e is edge
         elif choice == '4':